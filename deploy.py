@@ -1,27 +1,52 @@
 #!/usr/bin/env python3
 import os
 import sys
+import glob
 import yaml
-import time
 import shutil
 import pyincus
 import datetime
+import itertools
+import threading
 import argparse
+import concurrent.futures
 import textwrap
 import subprocess
 import ansible_runner
 
+from functools import lru_cache, wraps
 from ipaddress import ip_address, ip_network, IPv4Address, IPv6Address, IPv4Network, IPv6Network
 
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeLoader as _Loader
+
 now = datetime.datetime.now()
 
 CHALLENGES_DIRECTORY = "containers"
 CHALLENGE_FILE_NAME = "challenge.yml"
 CONFIGURATION_FILE_NAME = "config.yml"
 INVENTORY_FILE_NAME = "inventory"
+MAX_WORKERS = 32
+
+POLL_INITIAL_DELAY = 0.01
+POLL_MAX_DELAY = 0.5
+POLL_BACKOFF_FACTOR = 1.7
+
+# Forwards and ACLs are shared between instances, so updating them from
+# several threads at once must be serialized.
+_networkLock = threading.Lock()
+
+# Set when a parallel step fails so the other workers stop polling instead of keeping the script alive.
+_stopEvent = threading.Event()
 
-pyincus.incus.cwd = "/"
-pyincus.incus.check()
+# Only used for their validation methods, no need to create them for every field.
+_MODEL = pyincus.models._models.Model()
+_INSTANCE = pyincus.models.instances.Instance()
+_NETWORK_FORWARD = pyincus.models.forwards.NetworkForward()
+_NETWORK_ACL = pyincus.models.acls.NetworkACL()
+_POSSIBLE_PROTOCOLS = frozenset(protocol.lower() for protocol in _NETWORK_FORWARD.possibleProtocols)
 
 def printHelp():
     print("Review config file format.")
@@ -100,11 +125,106 @@ def printHelp():
         """)
     )
 
-def destroy(project: pyincus.models.projects.Project, args, *, instance: "pyincus.models.instances.Instance | str"):
+# Checking the incus client spawns a process, only do it once something actually talks to incus.
+@lru_cache(maxsize=None)
+def _ensureIncus():
+    pyincus.incus.cwd = "/"
+    pyincus.incus.check()
+
+@lru_cache(maxsize=None)
+def _remote(name: str) -> "pyincus.models.remotes.Remote | None":
+    _ensureIncus()
+
+    if(not pyincus.remotes.exists(name=name)):
+        return None
+
+    return pyincus.remotes.get(name=name)
+
+@lru_cache(maxsize=None)
+def _project(remoteName: str, projectName: str) -> "pyincus.models.projects.Project | None":
+    remote = _remote(remoteName)
+
+    if(remote is None or not remote.projects.exists(name=projectName)):
+        return None
+
+    return remote.projects.get(name=projectName)
+
+@lru_cache(maxsize=None)
+def _instance(remoteName: str, projectName: str, name: str) -> pyincus.models.instances.Instance:
+    return _project(remoteName, projectName).instances.get(name=name)
+
+def resolveInstance(function):
+    @wraps(function)
+    def wrapper(*args, instance, **kwargs):
+        # Resolved once here, nested calls then receive the Instance object and do not look it up again.
+        if(isinstance(instance, str)):
+            project = kwargs["project"] if "project" in kwargs else args[0]
+            instance = project.instances.get(name=instance)
+
+        return function(*args, instance=instance, **kwargs)
+
+    return wrapper
+
+def _globalAddresses(state: dict) -> tuple:
+    ipv4 = None
+    ipv6 = None
+
+    for address in state["network"]["eth0"]["addresses"]:
+        if(address["scope"] != "global"):
+            continue
+
+        if(ipv4 is None and address["family"] == "inet"):
+            ipv4 = address["address"]
+        elif(ipv6 is None and address["family"] == "inet6"):
+            ipv6 = address["address"]
+
+        if(ipv4 and ipv6):
+            break
+
+    return ipv4, ipv6
+
+def _aclsByInstance(project: pyincus.models.projects.Project) -> dict:
+    index = {}
+
+    for acl in project.acls.list():
+        # ACLs shared between instances are indexed under each of them, whether they can be deleted is only known once the instances are gone.
+        for usedBy in acl.usedBy:
+            if("/instances/" in usedBy):
+                name = usedBy.split("/instances/", 1)[1].split("?", 1)[0]
+                index.setdefault(name, []).append(acl)
+
+    return index
+
+def _workerCount(count: int) -> int:
+    return max(1, min(MAX_WORKERS, count))
+
+def _executor(count: int) -> concurrent.futures.ThreadPoolExecutor:
+    return concurrent.futures.ThreadPoolExecutor(max_workers=_workerCount(count))
+
+def runInParallel(function, items: list) -> list:
+    executor = _executor(len(items))
+    futures = [executor.submit(function, item) for item in items]
+
+    done, _ = concurrent.futures.wait(futures, return_when=concurrent.futures.FIRST_EXCEPTION)
+
+    for future in done:
+        if(future.exception() is not None):
+            # Fail as fast as the sequential version did, without waiting for the other instances.
+            _stopEvent.set()
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise future.exception()
+
+    executor.shutdown()
+
+    return [future.result() for future in futures]
+
+@resolveInstance
+def destroy(project: pyincus.models.projects.Project, args, *, instance: "pyincus.models.instances.Instance | str", acls: list=None, deleteACLs: bool=True) -> list:
     if(args.verbose):
         print(f"[DEBUG] Attempt to destroy instance: {instance.name}")
 
-    aclsToRemove = associatedACLs(project=project, args=args, instance=instance)
+    # When destroying several instances, the caller lists the ACLs once per project and passes them in.
+    aclsToRemove = associatedACLs(project=project, args=args, instance=instance) if acls is None else acls
 
     removeForwardPort(project=project, args=args, instance=instance)
 
@@ -134,11 +254,11 @@ def destroy(project: pyincus.models.projects.Project, args, *, instance: "pyincu
     if(args.verbose):
         print(f"[DEBUG] Instance was deleted: {instance.name}")
 
-    for acl in aclsToRemove:
-        if(len(acl.usedBy) == 0):
-            acl.delete()
-            if(args.verbose):
-                print(f"[DEBUG] ACL was deleted: {acl.name}")
+    # When destroying several instances at once, the caller deletes the ACLs once all of them are gone.
+    if(deleteACLs):
+        deleteUnusedACLs(args, acls=aclsToRemove)
+
+    return aclsToRemove
 
 
 def deploy(project: pyincus.models.projects.Project, args, *, name: str, nameSource: str, remoteSource: str=None, projectSource: str=None, config: dict=None, network: pyincus.models.networks.Network=None, isVM: bool=False, isClone: bool=False) -> pyincus.models.instances.Instance:
@@ -174,26 +294,26 @@ def deploy(project: pyincus.models.projects.Project, args, *, name: str, nameSou
 
     return instance
 
+@resolveInstance
 def associatedACLs(project: pyincus.models.projects.Project, args, *, instance: "pyincus.models.instances.Instance | str"):
-    toRemove = []
-    if(isinstance(instance, str)):
-        instance = project.instances.get(name=instance)
+    associated = _aclsByInstance(project).get(instance.name, [])
 
-    acls = project.acls.list()
-    for acl in acls:
-        if(len(acl.usedBy) == 1):
-            if(instance.name in acl.usedBy[0]):
-                toRemove.append(acl)
+    if(args.verbose):
+        for acl in associated:
+            print(f"[DEBUG] Found ACL attached to instance: {acl.name}")
 
-                if(args.verbose):
-                    print(f"[DEBUG] Found ACL to delete: {acl.name}")
+    return associated
 
-    return toRemove
+def deleteUnusedACLs(args, *, acls: list):
+    with _networkLock:
+        for acl in acls:
+            if(len(acl.usedBy) == 0):
+                acl.delete()
+                if(args.verbose):
+                    print(f"[DEBUG] ACL was deleted: {acl.name}")
 
+@resolveInstance
 def removeForwardPort(project: pyincus.models.projects.Project, args, *, instance: "pyincus.models.instances.Instance | str"):
-    if(isinstance(instance, str)):
-        instance = project.instances.get(name=instance)
-
     targetAddress4 = None
     targetAddress6 = None
 
@@ -207,47 +327,40 @@ def removeForwardPort(project: pyincus.models.projects.Project, args, *, instanc
                 targetAddress6 = devices["eth0"]["ipv6.address"]
 
     else:
-        for address in instance.state["network"]["eth0"]["addresses"]:
-            if(address["family"] == "inet" and address["scope"] == "global"):
-                targetAddress4 = address["address"]
-                break
-            if(address["family"] == "inet6" and address["scope"] == "global"):
-                targetAddress6 = address["address"]
-                break
+        targetAddress4, targetAddress6 = _globalAddresses(instance.state)
 
     if(not targetAddress4 is None or not targetAddress6 is None):
         network = project.networks.get(name=instance.expandedDevices["eth0"]["network"])
 
-        for forward in network.forwards.list():
-            for port in forward.ports:
-                if(port["target_address"] in [targetAddress4, targetAddress6]):
-                    forward.removePort(protocol=port["protocol"], listenPorts=port["listen_port"])
-                    if(args.verbose):
-                        print(f"[DEBUG] Forward port was removed: {port['listen_port']}")
+        with _networkLock:
+            for forward in network.forwards.list():
+                for port in forward.ports:
+                    if(port["target_address"] in [targetAddress4, targetAddress6]):
+                        forward.removePort(protocol=port["protocol"], listenPorts=port["listen_port"])
+                        if(args.verbose):
+                            print(f"[DEBUG] Forward port was removed: {port['listen_port']}")
 
+@resolveInstance
 def setNetworkACLs(project: pyincus.models.projects.Project, args, *, acls: list, instance: "pyincus.models.instances.Instance | str"):
-    if(isinstance(instance, str)):
-        instance = project.instances.get(name=instance)
-
     devices = instance.devices
 
     if(not "eth0" in devices):
         devices["eth0"] = instance.expandedDevices["eth0"]
-    
+
     if(not "security.acls" in devices["eth0"]):
         securityACL = []
     else:
         securityACL = devices["eth0"]["security.acls"].split(',')
 
-    for acl in acls:
-        if(not project.acls.exists(name=acl.name)):
-            acl = project.acls.create(name=acl.name, description=acl.description, egress=acl.egress, ingress=acl.ingress)
-        else:
-            acl = project.acls.get(name=acl.name)
+    with _networkLock:
+        existing = {acl.name for acl in project.acls.list()}
 
-        securityACL.append(acl.name)
+        for acl in acls:
+            if(not acl.name in existing):
+                project.acls.create(name=acl.name, description=acl.description, egress=acl.egress, ingress=acl.ingress)
+                existing.add(acl.name)
 
-    devices["eth0"]["security.acls"] = ','.join(securityACL)
+    devices["eth0"]["security.acls"] = ','.join(itertools.chain(securityACL, (acl.name for acl in acls)))
 
     instance.devices = devices
 
@@ -255,19 +368,9 @@ def setNetworkACLs(project: pyincus.models.projects.Project, args, *, acls: list
         for acl in acls:
             print(f"[DEBUG] ACL ({acl.name}) attached to Instance ({instance.name}).")
 
+@resolveInstance
 def setForwardsPorts(project: pyincus.models.projects.Project, args, *, instance: "pyincus.models.instances.Instance | str", network: str, listenAddress: str, forwards: list):
-    if(isinstance(instance, str)):
-        instance = project.instances.get(name=instance)
-
-    targetAddress4 = None
-    targetAddress6 = None
-    for address in instance.state["network"]["eth0"]["addresses"]:
-        if(address["family"] == "inet" and address["scope"] == "global"):
-            targetAddress4 = address["address"]
-            break
-        if(address["family"] == "inet6" and address["scope"] == "global"):
-            targetAddress6 = address["address"]
-            break
+    targetAddress4, targetAddress6 = _globalAddresses(instance.state)
 
     if(targetAddress4 is None and targetAddress6 is None):
         print("Failed to find IPv4 or IPv6 addresses for instance.")
@@ -276,70 +379,74 @@ def setForwardsPorts(project: pyincus.models.projects.Project, args, *, instance
     targetAddress = targetAddress4 if targetAddress4 else targetAddress6
 
     network = project.networks.get(name=network)
-    forward = network.forwards.get(listenAddress=listenAddress)
 
-    for f in forwards:
-        forward.addPort(protocol=f.protocol, listenPorts=f.source, targetAddress=targetAddress, targetPorts=f.destination)
-        if(args.verbose):
-            print(f"[DEBUG] Forward port was added: {f.source}")
+    with _networkLock:
+        forward = network.forwards.get(listenAddress=listenAddress)
 
-def setStaticIP(project: pyincus.models.projects.Project, args, *, instance: "pyincus.models.instances.Instance | str", ipv4: str=None, ipv6: str=None):
-    if(isinstance(instance, str)):
-        instance = project.instances.get(name=instance)
+        for f in forwards:
+            forward.addPort(protocol=f.protocol, listenPorts=f.source, targetAddress=targetAddress, targetPorts=f.destination)
+            if(args.verbose):
+                print(f"[DEBUG] Forward port was added: {f.source}")
 
+@resolveInstance
+def setStaticIP(project: pyincus.models.projects.Project, args, *, instance: "pyincus.models.instances.Instance | str", ipv4: str=None, ipv6: str=None):
     devices = instance.devices
+    eth0 = instance.expandedDevices["eth0"]
 
     if(not "eth0" in devices):
-        devices["eth0"] = instance.expandedDevices["eth0"]
+        devices["eth0"] = eth0
+
+    globalIPv4, globalIPv6 = _globalAddresses(instance.state) if(not ipv4 or not ipv6) else (None, None)
 
     if(ipv4):
         devices["eth0"]["ipv4.address"] = ipv4
-    else:
-        for address in instance.state["network"]["eth0"]["addresses"]:
-            if(address["family"] == "inet" and address["scope"] == "global"):
-                devices["eth0"]["ipv4.address"] = address["address"]
-                break
+    elif(globalIPv4):
+        devices["eth0"]["ipv4.address"] = globalIPv4
 
-    network = project.networks.get(name=instance.expandedDevices["eth0"]["network"])
+    networkConfig = project.networks.get(name=eth0["network"]).config
 
-    if("ipv6.dhcp.stateful" in network.config and network.config["ipv6.dhcp.stateful"]):
+    if("ipv6.dhcp.stateful" in networkConfig and networkConfig["ipv6.dhcp.stateful"]):
         if(ipv6):
             devices["eth0"]["ipv6.address"] = ipv6
-        else:
-            for address in instance.state["network"]["eth0"]["addresses"]:
-                if(address["family"] == "inet6" and address["scope"] == "global"):
-                    devices["eth0"]["ipv6.address"] = address["address"]
-                    break
+        elif(globalIPv6):
+            devices["eth0"]["ipv6.address"] = globalIPv6
 
     instance.devices = devices
 
     if(args.verbose):
         print(f"[DEBUG] Instance has now static ips: {instance.name} with {devices}.")
 
-def waitForIPAddresses(instance: "pyincus.models.instances.Instance | str", staticIPv4: str=None, staticIPv6: str=None):
-    if(isinstance(instance, str)):
-        instance = project.instances.get(name=instance)
-
+@resolveInstance
+def waitForIPAddresses(project: pyincus.models.projects.Project, *, instance: "pyincus.models.instances.Instance | str", staticIPv4: str=None, staticIPv6: str=None):
     if(instance.status.lower() != "running"):
         raise Exception(f"Instance is not running: {instance.status}")
 
-    network = project.networks.get(name=instance.expandedDevices["eth0"]["network"])
+    networkConfig = project.networks.get(name=instance.expandedDevices["eth0"]["network"]).config
+
+    ipv4Enabled = not pyincus.utils.isFalse(staticIPv4) and ("ipv4.address" in networkConfig and not pyincus.utils.isNone(networkConfig["ipv4.address"]))
+    ipv6Enabled = not pyincus.utils.isFalse(staticIPv6) and ("ipv6.address" in networkConfig and not pyincus.utils.isNone(networkConfig["ipv6.address"]))
 
-    ipv4Enabled = not pyincus.utils.isFalse(staticIPv4) and ("ipv4.address" in network.config and not pyincus.utils.isNone(network.config["ipv4.address"]))
-    ipv6Enabled = not pyincus.utils.isFalse(staticIPv6) and ("ipv6.address" in network.config and not pyincus.utils.isNone(network.config["ipv6.address"]))
+    subnet4 = ip_network(networkConfig["ipv4.address"], strict=False) if ipv4Enabled else None
+    subnet6 = ip_network(networkConfig["ipv6.address"], strict=False) if ipv6Enabled else None
 
-    subnet4 = ip_network(network.config["ipv4.address"], strict=False) if ipv4Enabled else None
-    subnet6 = ip_network(network.config["ipv6.address"], strict=False) if ipv6Enabled else None
+    # Compare the addresses as integers instead of building ip_address objects on every poll.
+    network4, netmask4 = (int(subnet4.network_address), int(subnet4.netmask)) if ipv4Enabled else (None, None)
+    network6, netmask6 = (int(subnet6.network_address), int(subnet6.netmask)) if ipv6Enabled else (None, None)
 
     ipv4 = None
     ipv6 = None
-    
+    delay = POLL_INITIAL_DELAY
+
     while(True):
-        for address in instance.state["network"]["eth0"]["addresses"]:
-            if(ipv4Enabled and address["family"] == "inet" and address["scope"] == "global" and ip_address(address["address"]) in subnet4):
+        addresses = instance.state["network"]["eth0"]["addresses"]
+
+        for address in addresses:
+            if(address["scope"] != "global"):
+                continue
+
+            if(ipv4Enabled and ipv4 is None and address["family"] == "inet" and (int(IPv4Address(address["address"])) & netmask4) == network4):
                 ipv4 = address["address"]
-            
-            if(ipv6Enabled and address["family"] == "inet6" and address["scope"] == "global" and ip_address(address["address"]) in subnet6):
+            elif(ipv6Enabled and ipv6 is None and address["family"] == "inet6" and (int(IPv6Address(address["address"])) & netmask6) == network6):
                 ipv6 = address["address"]
 
             if((not ipv4Enabled or ipv4) and (not ipv6Enabled or ipv6)):
@@ -349,15 +456,18 @@ def waitForIPAddresses(instance: "pyincus.models.instances.Instance | str", stat
             break
 
         # Avoid spamming too much
-        time.sleep(0.2)
+        if(_stopEvent.wait(delay)):
+            sys.exit(1)
 
-def waitForBoot(instance: "pyincus.models.instances.Instance | str"):
-    if(isinstance(instance, str)):
-        instance = project.instances.get(name=instance)
+        delay = min(delay * POLL_BACKOFF_FACTOR, POLL_MAX_DELAY)
 
+@resolveInstance
+def waitForBoot(project: pyincus.models.projects.Project, *, instance: "pyincus.models.instances.Instance | str"):
     if(instance.status.lower() != "running"):
         raise Exception(f"Instance is not running: {instance.status}")
 
+    delay = POLL_INITIAL_DELAY
+
     while(True):
         try:
             instance.exec("whoami")
@@ -368,18 +478,29 @@ def waitForBoot(instance: "pyincus.models.instances.Instance | str"):
                 sys.exit(1)
 
         # Avoid spamming too much
-        time.sleep(0.2)
+        if(_stopEvent.wait(delay)):
+            sys.exit(1)
+
+        delay = min(delay * POLL_BACKOFF_FACTOR, POLL_MAX_DELAY)
  
 class Model(object):
+    __slots__ = ()
+
+    # Only the fields identifying the object are printed, not the whole tree.
+    _reprFields = ()
+
     def __str__(self):
-        return str(self.__dict__)
+        return self.__repr__()
 
     def __repr__(self):
-        return self.__str__()
+        return f"{type(self).__name__}({', '.join(f'{field}={getattr(self, field)!r}' for field in self._reprFields)})"
 
 class Config(Model):
+    __slots__ = ("name", "remote", "project", "launch", "copy", "network")
+    _reprFields = ("name", "remote", "project")
+
     def __init__(self, name: str, remote: str, project: str, *, launch: dict=None, copy: dict=None, network: dict=None):
-        pyincus.models._models.Model().validateObjectFormat(name, remote, project)
+        _MODEL.validateObjectFormat(name, remote, project)
         self.name = name
         self.remote = remote
         self.project = project
@@ -392,54 +513,63 @@ class Config(Model):
         self.network = self.Network(**network) if network else None
 
     class Launch(Model):
+        __slots__ = ("image", "config", "isVM")
+        _reprFields = ("image", "isVM")
+
         def __init__(self, image, config: dict=None, is_virtual_machine: bool=False):
             self.image = self.Image(**image)
             self.config = config
             self.isVM = True if is_virtual_machine else False
 
         class Image(Model):
+            __slots__ = ("name", "remote")
+            _reprFields = ("remote", "name")
+
             def __init__(self, name: str, remote: str):
-                pyincus.models._models.Model().validateObjectFormat(remote)
-                pyincus.models.instances.Instance().validateImageName(name)
+                _MODEL.validateObjectFormat(remote)
+                _INSTANCE.validateImageName(name)
                 self.name = name
                 self.remote = remote
 
     class Copy(Model):
+        __slots__ = ("name", "remote", "project", "config")
+        _reprFields = ("remote", "project", "name")
+
         def __init__(self, name: str, remote: str, project: str=None, config: dict=None):
-            pyincus.models._models.Model().validateObjectFormat(name, remote, project)
+            _MODEL.validateObjectFormat(name, remote, project)
             self.name = name
             self.remote = remote
             self.project = project
             self.config = config
 
     class Network(Model):
+        __slots__ = ("name", "description", "action", "type", "config", "listenAddress", "ipv4", "ipv6", "staticIp", "forwards", "acls")
+        _reprFields = ("name",)
+
         def __init__(self, name: str, _type: str=None, description: str=None, config: dict=None, *, action: str='skip', listen_address: str=None, ipv4: str=None, ipv6: str=None, static_ip: bool=False, forwards: list=[], acls: list=[]):
-            pyincus.models._models.Model().validateObjectFormat(name)
+            _MODEL.validateObjectFormat(name)
             self.name = name
             self.description = description
             self.action = action
             self.type = _type
             self.config = config
             
-            if(listen_address): 
+            if(listen_address):
                 try:
-                    IPv4Address(listen_address)
-                except:
-                    try:
-                        IPv6Address(listen_address)
-                    except:
-                        raise Exception("listen_address must be a valid IPv4/IPv6 address.")
+                    ip_address(listen_address)
+                except ValueError:
+                    raise Exception("listen_address must be a valid IPv4/IPv6 address.")
 
             if(ipv4 and not pyincus.utils.isFalse(ipv4)):
                 try:
                     IPv4Address(ipv4)
-                except:
+                except ValueError:
                     raise Exception("ipv4 must be a valid IPv4 address.")
 
             if(ipv6 and not pyincus.utils.isFalse(ipv6)):
                 try:
                     IPv6Address(ipv6)
-                except:
+                except ValueError:
                     raise Exception("ipv6 must be a valid IPv6 address.")
 
             self.listenAddress = listen_address
@@ -458,30 +588,128 @@ class Config(Model):
                 self.acls.append(self.ACL(**acl))
 
         class Forward(Model):
+            __slots__ = ("source", "destination", "protocol")
+            _reprFields = ("source", "destination", "protocol")
+
             def __init__(self, source: int, destination: int, protocol: str="tcp"):
-                pyincus.models.forwards.NetworkForward().validatePortList(ports=source)
-                pyincus.models.forwards.NetworkForward().validatePortList(ports=destination)
+                _NETWORK_FORWARD.validatePortList(ports=source)
+                _NETWORK_FORWARD.validatePortList(ports=destination)
+
+                protocol = protocol.lower()
 
-                if(not protocol.lower() in pyincus.models.forwards.NetworkForward().possibleProtocols):
-                    raise Exception(f"Forward protocol must be within these values: {pyincus.models.forwards.NetworkForward().possibleProtocols}")
+                if(not protocol in _POSSIBLE_PROTOCOLS):
+                    raise Exception(f"Forward protocol must be within these values: {_NETWORK_FORWARD.possibleProtocols}")
 
                 self.source = source
                 self.destination = destination
-                self.protocol = protocol.lower()
+                self.protocol = protocol
 
         class ACL(Model):
+            __slots__ = ("name", "description", "egress", "ingress")
+            _reprFields = ("name",)
+
             def __init__(self, name: str, *, description: str=None, egress: list=[], ingress: list=[]):
-                pyincus.models._models.Model().validateObjectFormat(name)
+                _MODEL.validateObjectFormat(name)
 
                 self.name = name
                 self.description = description
                 
-                pyincus.models.acls.NetworkACL().validateGress(egress)
-                pyincus.models.acls.NetworkACL().validateGress(ingress)
+                _NETWORK_ACL.validateGress(egress)
+                _NETWORK_ACL.validateGress(ingress)
 
                 self.egress = egress
                 self.ingress = ingress
 
+def waitForInstance(conf: Config, project: pyincus.models.projects.Project, instance: pyincus.models.instances.Instance):
+    waitForIPAddresses(project=project, instance=instance, staticIPv4=conf.network.ipv4 if conf.network else None, staticIPv6=conf.network.ipv6 if conf.network else None)
+
+    if(conf.launch and conf.launch.isVM):
+        waitForBoot(project=project, instance=instance)
+
+def applyNetworkConfig(args, conf: Config, project: pyincus.models.projects.Project, instance: pyincus.models.instances.Instance):
+    if(conf.network):
+        if(conf.network.staticIp or conf.network.ipv4 or conf.network.ipv6):
+            setStaticIP(project=project, args=args, instance=instance, ipv4=conf.network.ipv4, ipv6=conf.network.ipv6)
+
+        instance.restart()
+
+        if(conf.network.acls):
+            setNetworkACLs(project=project, args=args, instance=instance, acls=conf.network.acls)
+
+        if(conf.network.forwards):
+            waitForIPAddresses(project=project, instance=instance, staticIPv4=conf.network.ipv4, staticIPv6=conf.network.ipv6)
+            setForwardsPorts(project=project, args=args, instance=instance, network=conf.network.name, listenAddress=conf.network.listenAddress, forwards=conf.network.forwards)
+    else:
+        instance.restart()
+
+def _removeTrees(paths: list):
+    def onerror(function, path, excInfo):
+        print(f"Failed to remove {path}: {excInfo[1]}")
+
+    for path in paths:
+        shutil.rmtree(path, onerror=onerror)
+
+def removeArtifacts(challengePath: str) -> threading.Thread:
+    path = os.path.join(challengePath, "artifacts")
+
+    # Renaming is instant and frees the artifacts folder for the next run, the actual removal happens in the background.
+    # The thread is not a daemon so the interpreter still waits for it before exiting.
+    try:
+        os.rename(path, f"{path}.{os.getpid()}.trash")
+        paths = []
+    except FileNotFoundError:
+        paths = []
+    except OSError as error:
+        print(f"Failed to move {path} aside, removing it in place: {error}")
+        paths = [path]
+
+    # Also picks up what earlier runs could not remove.
+    paths += glob.glob(f"{glob.escape(path)}.*.trash")
+
+    thread = threading.Thread(target=_removeTrees, args=(paths,))
+    thread.start()
+
+    return thread
+
+def destroyAll(args, *, config: list) -> bool:
+    success = True
+    aclsToRemove = {}
+    aclIndexes = {}
+
+    for conf in config:
+        if((conf.remote, conf.project) in aclIndexes):
+            continue
+
+        try:
+            aclIndexes[(conf.remote, conf.project)] = _aclsByInstance(_project(conf.remote, conf.project))
+        except Exception as error:
+            # Still destroy the instances, only their ACLs are left behind.
+            print(f"Failed to list ACLs of project {conf.project}: {type(error).__name__}: {error}")
+            aclIndexes[(conf.remote, conf.project)] = {}
+            success = False
+
+    with _executor(len(config)) as executor:
+        futures = {executor.submit(destroy, project=_project(conf.remote, conf.project), args=args, instance=conf.name, acls=aclIndexes[(conf.remote, conf.project)].get(conf.name, []), deleteACLs=False): conf for conf in config}
+
+        # One failing instance must not prevent the others from being cleaned up.
+        for future in concurrent.futures.as_completed(futures):
+            conf = futures[future]
+            try:
+                for acl in future.result():
+                    aclsToRemove.setdefault((conf.remote, conf.project, acl.name), acl)
+            except (Exception, SystemExit) as error:
+                print(f"Failed to destroy instance {conf.name}: {type(error).__name__}: {error}")
+                success = False
+
+    # ACLs shared between the destroyed instances are only unused once every one of them is gone.
+    try:
+        deleteUnusedACLs(args, acls=list(aclsToRemove.values()))
+    except Exception as error:
+        print(f"Failed to delete ACLs: {type(error).__name__}: {error}")
+        success = False
+
+    return success
+
 if __name__ == '__main__':
     parser = argparse.ArgumentParser()
     parser.add_argument("challengePath", type=str)
@@ -505,25 +733,21 @@ if __name__ == '__main__':
             print("Missing --remote and/or --project arguments.")
             sys.exit(1)
 
-        if(not pyincus.remotes.exists(name=args.remote)):
+        if(_remote(args.remote) is None):
             print(f"Remote was not found: {args.remote}")
             sys.exit(1)
 
-        remote = pyincus.remotes.get(name=args.remote)
+        project = _project(args.remote, args.project)
 
-        if(not remote.projects.exists(name=args.project)):
+        if(project is None):
             print(f"Project was not found: {args.project}")
             sys.exit(1)
 
-        project = remote.projects.get(name=args.project)
-
         if(not project.instances.exists(name=args.challengePath)):
             print(f"Instance was not found: {args.challengePath}")
             sys.exit(1)
 
-        instance = project.instances.get(name=args.challengePath)
-
-        destroy(project=project, args=args, instance=instance)
+        destroy(project=project, args=args, instance=args.challengePath)
         sys.exit(1)
 
     if(os.path.exists(args.challengePath) and os.path.isdir(args.challengePath)):
@@ -557,8 +781,8 @@ if __name__ == '__main__':
         print(f"Missing challenge file: {challengeYamlPath}")
         sys.exit(1)
 
-    with open(configPath) as f:
-        configContent = yaml.safe_load(f.read())
+    with open(configPath, "rb") as f:
+        configContent = yaml.load(f, Loader=_Loader)
 
     if(not "config" in configContent):
         printHelp()
@@ -581,20 +805,21 @@ if __name__ == '__main__':
 
     if(args.verbose):
         print(f"[DEBUG] config: {config}")
-    
+
+    # Keep the handles obtained while deploying so the following steps do not have to look them up again.
+    contexts = []
+
     for conf in config:
-        if(not pyincus.remotes.exists(name=conf.remote)):
+        if(_remote(conf.remote) is None):
             print(f"Remote was not found: {conf.remote}")
             sys.exit(1)
 
-        remote = pyincus.remotes.get(name=conf.remote)
+        project = _project(conf.remote, conf.project)
 
-        if(not remote.projects.exists(name=conf.project)):
+        if(project is None):
             print(f"Project was not found: {conf.project}")
             sys.exit(1)
 
-        project = remote.projects.get(name=conf.project)
-
         kwargs = {
             "name": conf.name,
             "remoteSource": None,
@@ -656,54 +881,29 @@ if __name__ == '__main__':
         if(not args.apply):
             instance = deploy(project=project, args=args, **kwargs)
         else:
-            instance = project.instances.get(name=conf.name)
+            instance = _instance(conf.remote, conf.project, conf.name)
 
-    for conf in config:
-        project = pyincus.remotes.get(name=conf.remote).projects.get(name=conf.project)
-        instance = project.instances.get(name=conf.name)
-        waitForIPAddresses(instance=instance, staticIPv4=conf.network.ipv4, staticIPv6=conf.network.ipv6)
+        contexts.append((conf, project, instance))
+
+    runInParallel(lambda context: waitForInstance(*context), contexts)
 
-        if(conf.launch and conf.launch.isVM):
-            waitForBoot(instance=instance)
-    
-    r = ansible_runner.run(debug=True, private_data_dir=challengePath, playbook=CHALLENGE_FILE_NAME)
+    # One fork per instance so the playbook does not run in batches of Ansible's default 5 hosts.
+    r = ansible_runner.run(debug=True, private_data_dir=challengePath, playbook=CHALLENGE_FILE_NAME, forks=_workerCount(len(config)))
 
     if(r.rc != 0):
-        shutil.rmtree(os.path.join(challengePath, "artifacts"))
+        removeArtifacts(challengePath)
 
         if(not args.keepInstancesOnFailure):
-            for conf in config:
-                project = pyincus.remotes.get(name=conf.remote).projects.get(name=conf.project)
-                instance = project.instances.get(name=conf.name)
-                destroy(project=project, args=args, instance=instance)
+            destroyAll(args, config=config)
 
         sys.exit(1)
 
-    shutil.rmtree(os.path.join(challengePath, "artifacts"))
+    removeArtifacts(challengePath)
 
-    for conf in config:
-        if(conf.network):
-            project = pyincus.remotes.get(name=conf.remote).projects.get(name=conf.project)
-            instance = project.instances.get(name=conf.name)
-
-            if(conf.network.staticIp or conf.network.ipv4 or conf.network.ipv6):
-                setStaticIP(project=project, args=args, instance=instance, ipv4=conf.network.ipv4, ipv6=conf.network.ipv6)
-        
-            instance.restart()
-                
-            if(conf.network.acls):
-                setNetworkACLs(project=project, args=args, instance=instance, acls=conf.network.acls)
-
-            if(conf.network.forwards):
-                waitForIPAddresses(instance=instance, staticIPv4=conf.network.ipv4, staticIPv6=conf.network.ipv6)
-                setForwardsPorts(project=project, args=args, instance=instance, network=conf.network.name, listenAddress=conf.network.listenAddress, forwards=conf.network.forwards)
-        else:
-            project.instances.get(name=conf.name).restart()
+    runInParallel(lambda context: applyNetworkConfig(args, *context), contexts)
 
     print(f"Elasped time: {(datetime.datetime.now() - now).total_seconds()}")
 
     if(args.test):
-        for conf in config:
-            project = pyincus.remotes.get(name=conf.remote).projects.get(name=conf.project)
-            instance = project.instances.get(name=conf.name)
-            destroy(project=project, args=args, instance=instance)
\ No newline at end of file
+        if(not destroyAll(args, config=config)):
+            sys.exit(1)
\ No newline at end of file